@@ -0,0 +1,15 @@
+"""
+PyInstaller entry point for the gytmdl sidecar binary.
+Calls the CLI function through one absolute import, so the frozen binary
+does not depend on how gytmdl's own __main__ module resolves its imports.
+"""
+
+import sys
+
+# The frozen interpreter loads bytecode from the archive; never try to write it
+sys.dont_write_bytecode = True
+
+from gytmdl.cli import main as _main
+
+if __name__ == "__main__":
+    _main()
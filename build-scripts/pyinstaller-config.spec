@@ -6,6 +6,7 @@ This creates platform-specific executables that can be bundled with the Tauri ap
 
 import os
 import sys
+import struct
 from pathlib import Path
 
 # Get the gytmdl source directory - use a more reliable path detection
@@ -23,7 +24,7 @@ sys.path.insert(0, gytmdl_src)
 # Platform-specific binary name
 platform_suffix = ""
 if sys.platform == "win32":
-    if "64" in str(sys.maxsize):
+    if struct.calcsize("P") == 8:
         platform_suffix = "-x86_64-pc-windows-msvc"
     else:
         platform_suffix = "-i686-pc-windows-msvc"
@@ -42,10 +43,15 @@ elif sys.platform.startswith("linux"):
     else:
         platform_suffix = "-unknown-linux-gnu"
 
-binary_name = f"gytmdl{platform_suffix}"
+# build-sidecars.py passes the final name so the binary needs no renaming
+binary_name = os.environ.get("GYTMDL_SIDECAR_NAME", f"gytmdl{platform_suffix}")
+
+# UPX is the slowest single-threaded step of a one-file build; development
+# builds can turn it off with build-sidecars.py --no-upx
+use_upx = os.environ.get("GYTMDL_SIDECAR_UPX", "1") != "0"
 
 a = Analysis(
-    [os.path.join(gytmdl_src, "gytmdl", "__main__.py")],
+    [os.path.join(spec_dir, "gytmdl_entry.py")],
     pathex=[gytmdl_src],
     binaries=[],
     datas=[
@@ -73,6 +79,16 @@ a = Analysis(
         'pandas',
         'PIL',
         'cv2',
+        'IPython',
+        # Standard library packages a CLI never imports at runtime; pruning
+        # them also shortens PyInstaller's module graph analysis
+        'test',
+        'unittest',
+        'pydoc',
+        'pydoc_data',
+        'lib2to3',
+        'idlelib',
+        'turtledemo',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -93,7 +109,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,  # Enable UPX compression to reduce binary size
+    upx=use_upx,  # UPX compression reduces binary size
     upx_exclude=[],
     runtime_tmpdir=None,
     console=True,  # gytmdl is a console application
@@ -0,0 +1,63 @@
+"""
+Platform detection shared by the gytmdl-gui build and packaging scripts.
+Results never change within a process, so every lookup is computed once.
+"""
+
+import functools
+import platform
+import struct
+from typing import Dict
+
+
+class UnsupportedPlatformError(Exception):
+    """Raised when there is no build target for the current platform."""
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def platform_info() -> Dict[str, str]:
+    """Get current platform information."""
+    uname = platform.uname()
+    system = uname.system.lower()
+    machine = uname.machine.lower()
+    
+    if system == "windows":
+        is_64bit = struct.calcsize("P") == 8
+        return {
+            "os": "windows",
+            "arch": "x86_64" if is_64bit else "i686",
+            "target": "x86_64-pc-windows-msvc" if is_64bit else "i686-pc-windows-msvc",
+            "extension": ".exe",
+            "installer_formats": ["msi", "nsis"]
+        }
+    elif system == "darwin":
+        return {
+            "os": "macos",
+            "arch": "aarch64" if machine == "arm64" else "x86_64",
+            "target": "aarch64-apple-darwin" if machine == "arm64" else "x86_64-apple-darwin",
+            "extension": "",
+            "installer_formats": ["dmg", "app"]
+        }
+    elif system == "linux":
+        return {
+            "os": "linux",
+            "arch": "x86_64" if machine == "x86_64" else "aarch64" if machine == "aarch64" else "unknown",
+            "target": f"{machine}-unknown-linux-gnu",
+            "extension": "",
+            "installer_formats": ["deb", "rpm", "appimage"]
+        }
+    else:
+        raise UnsupportedPlatformError(f"Unsupported platform: {system}")
+
+
+@functools.lru_cache(maxsize=None)
+def target_triple() -> str:
+    """Get the Rust target triple for the current platform."""
+    return platform_info()["target"]
+
+
+@functools.lru_cache(maxsize=None)
+def binary_name(prefix: str) -> str:
+    """Get the Tauri sidecar file name for a binary, e.g. gytmdl-x86_64-unknown-linux-gnu."""
+    info = platform_info()
+    return f"{prefix}-{info['target']}{info['extension']}"
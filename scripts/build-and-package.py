@@ -11,61 +11,169 @@ This script handles the complete build process including:
 import os
 import sys
 import subprocess
-import platform
 import shutil
+import hashlib
+import mmap
 import json
 import argparse
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from _platform import UnsupportedPlatformError, platform_info
+
+HASH_BUFFER_SIZE = 1 << 20
+# Tauri writes each bundle format to its own bundle/<directory>/
+BUNDLE_LAYOUT = {
+    "app": ("macos", ".app"),
+    "msi": ("msi", ".msi"),
+    "nsis": ("nsis", "-setup.exe"),
+    "dmg": ("dmg", ".dmg"),
+    "deb": ("deb", ".deb"),
+    "rpm": ("rpm", ".rpm"),
+    "appimage": ("appimage", ".AppImage"),
+}
+_BUNDLE_DIR_FORMATS = {directory: (format_name, suffix)
+                       for format_name, (directory, suffix) in BUNDLE_LAYOUT.items()}
+# Keeps a hung tool from stalling the pipeline
+PROBE_TIMEOUT = 5
+DEPS_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "gytmdl-gui" / "deps.json"
+# Everything `npm run build` reads besides node_modules, relative to the project root
+FRONTEND_INPUT_DIRS = ("src", "public")
+FRONTEND_INPUT_FILES = ("index.html", "package.json", "vite.config.ts", "tsconfig.json", "tsconfig.node.json")
+# Environment variables Vite exposes to the bundle or that Tauri's CLI sets for it
+FRONTEND_ENV_PREFIXES = ("VITE_", "TAURI_ENV_")
+
+
 class BuildError(Exception):
     """Custom exception for build errors."""
     pass
 
+
+def _run_streaming(cmd: List[str], cwd: Path, log_path: Path, prefix: str = "",
+                   env: Optional[Dict[str, str]] = None) -> None:
+    """Run a command, echoing its output line by line and appending it to a log.
+    
+    Output is never buffered in memory, and the prefix keeps lines from
+    concurrently running stages apart on the console. Raises
+    CalledProcessError if the command fails; its output is in the log.
+    """
+    # Decode and log as UTF-8 rather than the locale encoding, which on
+    # Windows cannot represent everything npm, vite and cargo print
+    with open(log_path, "a", encoding="utf-8") as log:
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                bufsize=1, encoding="utf-8", errors="replace")
+        with proc.stdout:
+            for line in proc.stdout:
+                sys.stdout.write(prefix + line)
+                log.write(line)
+        returncode = proc.wait()
+    
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
 class PackagingPipeline:
     """Main class for handling the complete build and packaging pipeline."""
     
-    def __init__(self, project_root: Path, config: Dict):
+    def __init__(self, project_root: Path, config: Dict, clean: bool = False):
         self.project_root = Path(project_root).resolve()
         self.config = config
-        self.platform_info = self._get_platform_info()
+        self.clean = clean
+        self._probe_cache: Optional[Dict[str, Dict]] = None
+        self._probe_cache_dirty = False
+        self._stat_cache: Dict[Path, Optional[os.stat_result]] = {}
+        self._installer_checksums: Dict[Path, str] = {}
+        self._frontend_built = False
+        try:
+            self.platform_info = platform_info()
+        except UnsupportedPlatformError as e:
+            raise BuildError(str(e)) from e
         self.build_dir = self.project_root / "target" / "release"
-        self.dist_dir = self.project_root / "dist"
+        # Installers and checksums stay out of dist/, Vite's outDir and Tauri's
+        # frontendDist, or the next Tauri build would embed them into the app
+        self.dist_dir = self.project_root / "target" / "release-artifacts"
+        # Stage logs stay out of dist/ too: Vite empties it while the sidecar
+        # build is still logging
+        self.logs_dir = self.project_root / "target" / "logs"
         
         # Ensure directories exist
         self.dist_dir.mkdir(parents=True, exist_ok=True)
         
-    def _get_platform_info(self) -> Dict[str, str]:
-        """Get current platform information."""
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-        
-        if system == "windows":
-            return {
-                "os": "windows",
-                "arch": "x86_64" if "64" in str(sys.maxsize) else "i686",
-                "target": "x86_64-pc-windows-msvc" if "64" in str(sys.maxsize) else "i686-pc-windows-msvc",
-                "extension": ".exe",
-                "installer_formats": ["msi", "nsis"]
-            }
-        elif system == "darwin":
-            return {
-                "os": "macos",
-                "arch": "aarch64" if machine == "arm64" else "x86_64",
-                "target": "aarch64-apple-darwin" if machine == "arm64" else "x86_64-apple-darwin",
-                "extension": "",
-                "installer_formats": ["dmg", "app"]
-            }
-        elif system == "linux":
-            return {
-                "os": "linux",
-                "arch": "x86_64" if machine == "x86_64" else "aarch64" if machine == "aarch64" else "unknown",
-                "target": f"{machine}-unknown-linux-gnu",
-                "extension": "",
-                "installer_formats": ["deb", "rpm", "appimage"]
-            }
-        else:
-            raise BuildError(f"Unsupported platform: {system}")
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a path once, returning None if it does not exist."""
+        if path not in self._stat_cache:
+            try:
+                self._stat_cache[path] = os.stat(path)
+            except FileNotFoundError:
+                self._stat_cache[path] = None
+        return self._stat_cache[path]
+    
+    def _stage_log(self, stage: str) -> Path:
+        """Get a fresh log file for a stage's subprocess output."""
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        log_path = self.logs_dir / f"{stage}.log"
+        log_path.write_text("")
+        return log_path
+    
+    def _print_log_tail(self, log_path: Path, lines: int = 40) -> None:
+        """Print the last lines of a stage log for failure diagnostics."""
+        try:
+            tail = log_path.read_text(encoding="utf-8", errors="replace").splitlines()[-lines:]
+        except OSError:
+            return
+        for line in tail:
+            print(f"  {line}")
+    
+    def _load_probe_cache(self) -> None:
+        """Read cached tool probes from disk, once."""
+        if self._probe_cache is not None:
+            return
+        try:
+            with open(DEPS_CACHE_PATH) as f:
+                self._probe_cache = json.load(f)
+        except (OSError, ValueError):
+            self._probe_cache = {}
+    
+    def _probe_tool(self, name: str) -> Optional[Tuple[str, str]]:
+        """Find a tool and its version, reusing the cached probe while the binary is unchanged."""
+        path = shutil.which(name)
+        if path is None:
+            return None
+        
+        self._load_probe_cache()
+        mtime = os.path.getmtime(path)
+        cached = self._probe_cache.get(name)
+        if cached and cached.get("path") == path and cached.get("mtime") == mtime:
+            return path, cached["version"]
+        
+        try:
+            result = subprocess.run([path, "--version"], capture_output=True,
+                                  stdin=subprocess.DEVNULL, text=True, check=True,
+                                  timeout=PROBE_TIMEOUT)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return None
+        
+        output = (result.stdout or result.stderr).strip()
+        version = output.splitlines()[0] if output else "unknown"
+        self._probe_cache[name] = {"path": path, "mtime": mtime, "version": version}
+        self._probe_cache_dirty = True
+        return path, version
+    
+    def _save_probe_cache(self) -> None:
+        """Persist tool probes so later runs can skip the subprocesses."""
+        if not self._probe_cache_dirty:
+            return
+        try:
+            DEPS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Only this script reads the cache, so write it compact and in one call
+            DEPS_CACHE_PATH.write_text(json.dumps(self._probe_cache, separators=(",", ":")))
+            self._probe_cache_dirty = False
+        except OSError:
+            pass
     
     def check_dependencies(self) -> bool:
         """Check if all required build dependencies are available."""
@@ -80,35 +188,58 @@ class PackagingPipeline:
         
         missing_tools = []
         
+        # Probes are independent, so any that miss the cache run side by side;
+        # load the cache first so the workers share it
+        self._load_probe_cache()
+        with ThreadPoolExecutor(max_workers=len(required_tools)) as executor:
+            probes = dict(zip(required_tools, executor.map(self._probe_tool, required_tools)))
+        
         for tool, description in required_tools.items():
-            try:
-                subprocess.run([tool, "--version"], 
-                             capture_output=True, check=True)
-                print(f"  ✓ {tool} found")
-            except (subprocess.CalledProcessError, FileNotFoundError):
+            probe = probes[tool]
+            if probe:
+                print(f"  ✓ {tool} found ({probe[1]})")
+            else:
                 print(f"  ✗ {tool} not found - {description}")
                 missing_tools.append(tool)
         
+        # `cargo tauri` is an external cargo subcommand, which cargo looks up on
+        # PATH and in $CARGO_HOME/bin; checking there needs no subprocess
+        cargo_home = Path(os.environ.get("CARGO_HOME") or Path.home() / ".cargo")
+        tauri_cli = f"cargo-tauri{self.platform_info['extension']}"
+        if shutil.which("cargo-tauri") or self._stat(cargo_home / "bin" / tauri_cli) is not None:
+            print("  ✓ cargo-tauri found")
+        else:
+            print("  ✗ cargo-tauri not found - Tauri CLI is required for the app build "
+                  "(cargo install tauri-cli)")
+            missing_tools.append("cargo-tauri")
+        
         # Platform-specific checks
         if self.platform_info["os"] == "windows":
             # Check for Windows-specific tools
             if self.config.get("code_signing", {}).get("enabled", False):
-                try:
-                    subprocess.run(["signtool"], capture_output=True, check=True)
+                if shutil.which("signtool"):
                     print("  ✓ signtool found (code signing available)")
-                except (subprocess.CalledProcessError, FileNotFoundError):
+                else:
                     print("  ⚠ signtool not found (code signing disabled)")
         
         elif self.platform_info["os"] == "macos":
             # Check for macOS-specific tools
             if self.config.get("code_signing", {}).get("enabled", False):
-                try:
-                    subprocess.run(["codesign", "--version"], 
-                                 capture_output=True, check=True)
+                if shutil.which("codesign"):
                     print("  ✓ codesign found")
-                except (subprocess.CalledProcessError, FileNotFoundError):
+                else:
                     print("  ⚠ codesign not found (code signing disabled)")
         
+        # Optional tools
+        if os.environ.get("RUSTC_WRAPPER"):
+            print(f"  ✓ RUSTC_WRAPPER={os.environ['RUSTC_WRAPPER']} (Rust compile cache)")
+        elif shutil.which("sccache"):
+            print("  ✓ sccache found (Rust compile cache enabled)")
+        else:
+            print("  ⚠ sccache not found (Rust builds will not be cached)")
+        
+        self._save_probe_cache()
+        
         if missing_tools:
             print(f"\n❌ Missing required tools: {', '.join(missing_tools)}")
             return False
@@ -116,6 +247,20 @@ class PackagingPipeline:
         print("✅ All dependencies satisfied")
         return True
     
+    def _sidecars_up_to_date(self, build_script: Path) -> bool:
+        """Check the sidecar builder's input key in-process, without spawning the build."""
+        try:
+            spec = importlib.util.spec_from_file_location("build_sidecars", build_script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            builder = module.SidecarBuilder(self.project_root.parent / "gytmdl",
+                                            self.project_root / "src-tauri" / "sidecars",
+                                            clean=self.clean)
+            return builder.inputs_unchanged()
+        except (Exception, SystemExit):
+            # Any doubt means a real build, which repeats the check itself
+            return False
+    
     def build_sidecar_binaries(self) -> bool:
         """Build gytmdl sidecar binaries."""
         print("🔨 Building sidecar binaries...")
@@ -125,6 +270,13 @@ class PackagingPipeline:
             print("❌ Sidecar build script not found")
             return False
         
+        # Sources, spec and interpreter all match the last successful build
+        if self._sidecars_up_to_date(build_script):
+            print("⏭ Sidecar binaries up to date, skipping build")
+            return True
+        
+        log_path = self._stage_log("sidecar")
+        
         try:
             cmd = [
                 sys.executable, str(build_script),
@@ -132,42 +284,149 @@ class PackagingPipeline:
                 "--output-dir", str(self.project_root / "src-tauri" / "sidecars")
             ]
             
-            result = subprocess.run(cmd, cwd=self.project_root, 
-                                  capture_output=True, text=True)
+            # Sidecar builds are incremental unless a clean build is requested
+            if self.clean:
+                cmd.append("--clean")
             
-            if result.returncode != 0:
-                print(f"❌ Sidecar build failed:")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
-                return False
+            _run_streaming(cmd, self.project_root, log_path, prefix="[sidecar] ")
             
             print("✅ Sidecar binaries built successfully")
             return True
             
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Sidecar build failed with exit code {e.returncode} (log: {log_path}):")
+            self._print_log_tail(log_path)
+            return False
         except Exception as e:
             print(f"❌ Sidecar build error: {e}")
             return False
     
+    def _npm_lock_hash(self) -> str:
+        """Hash the npm manifests that decide what ends up in node_modules."""
+        sha256_hash = hashlib.sha256()
+        for name in ("package.json", "package-lock.json"):
+            try:
+                sha256_hash.update((self.project_root / name).read_bytes())
+            except FileNotFoundError:
+                pass
+        return sha256_hash.hexdigest()
+    
+    def _frontend_input_key(self, lock_hash: str) -> str:
+        """Key the frontend build on its sources' paths, sizes and mtimes.
+        
+        Metadata is enough to notice edits without reading every file, and
+        the lockfile hash covers dependency changes. Vite's .env files and
+        the variables it embeds are part of the key too.
+        """
+        root = os.fspath(self.project_root)
+        env_files = sorted(entry.name for entry in os.scandir(root)
+                           if entry.name.startswith(".env") and entry.is_file())
+        inputs = []
+        for name in (*FRONTEND_INPUT_FILES, *env_files):
+            try:
+                inputs.append((name, os.stat(os.path.join(root, name))))
+            except FileNotFoundError:
+                pass
+        
+        stack = [os.path.join(root, name) for name in reversed(FRONTEND_INPUT_DIRS)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except FileNotFoundError:
+                continue
+            # Reverse so subdirectories are visited in name order
+            for entry in reversed(entries):
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    inputs.append((entry.path[len(root) + 1:], entry.stat(follow_symlinks=False)))
+        
+        key_hash = hashlib.blake2b(lock_hash.encode(), digest_size=16)
+        for rel_path, st in inputs:
+            key_hash.update(rel_path.encode())
+            key_hash.update(st.st_size.to_bytes(8, "little"))
+            key_hash.update(st.st_mtime_ns.to_bytes(8, "little"))
+        for name, value in sorted(os.environ.items()):
+            if name.startswith(FRONTEND_ENV_PREFIXES):
+                key_hash.update(f"{name}={value}\0".encode())
+        return key_hash.hexdigest()
+    
     def build_frontend(self) -> bool:
         """Build the frontend application."""
         print("🎨 Building frontend...")
         
+        log_path = self._stage_log("frontend")
+        
+        stamp_path = self.project_root / "node_modules" / ".npm-install-stamp"
+        
         try:
-            # Install dependencies
-            subprocess.run(["npm", "install"], 
-                         cwd=self.project_root, check=True)
+            # Install dependencies, unless node_modules already matches the lockfile
+            lock_hash = self._npm_lock_hash()
+            try:
+                up_to_date = stamp_path.read_text().strip() == lock_hash
+            except OSError:
+                up_to_date = False
+            
+            if up_to_date:
+                print("⏭ npm dependencies unchanged, skipping install")
+            else:
+                if (self.project_root / "package-lock.json").exists():
+                    install_cmd = ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"]
+                else:
+                    install_cmd = ["npm", "install"]
+                _run_streaming(install_cmd, self.project_root, log_path, prefix="[frontend] ")
+                stamp_path.parent.mkdir(exist_ok=True)
+                stamp_path.write_text(lock_hash)
+            
+            # Build frontend, unless dist/ came from these exact inputs
+            # Kept outside node_modules, which npm ci wipes on every install
+            build_stamp_path = self.project_root / "target" / ".frontend-build-stamp"
+            build_key = self._frontend_input_key(lock_hash)
+            try:
+                built = (build_stamp_path.read_text().strip() == build_key
+                         and (self.project_root / "dist" / "index.html").is_file())
+            except OSError:
+                built = False
             
-            # Build frontend
-            subprocess.run(["npm", "run", "build"], 
-                         cwd=self.project_root, check=True)
+            if built:
+                print("⏭ Frontend sources unchanged, reusing dist/")
+            else:
+                # Drop the old stamp first so a failed build never leaves a
+                # half-written dist/ that still looks current
+                try:
+                    build_stamp_path.unlink()
+                except FileNotFoundError:
+                    pass
+                _run_streaming(["npm", "run", "build"], self.project_root,
+                               log_path, prefix="[frontend] ")
+                build_stamp_path.parent.mkdir(exist_ok=True)
+                build_stamp_path.write_text(build_key)
             
+            self._frontend_built = True
             print("✅ Frontend built successfully")
             return True
             
         except subprocess.CalledProcessError as e:
+            print(f"❌ Frontend build failed: {' '.join(e.cmd)} exited with {e.returncode} (log: {log_path}):")
+            self._print_log_tail(log_path)
+            return False
+        except OSError as e:
             print(f"❌ Frontend build failed: {e}")
             return False
     
+    def _rust_build_env(self) -> Dict[str, str]:
+        """Get the cargo environment, routing rustc through sccache when available."""
+        env = os.environ.copy()
+        
+        # An explicit wrapper from the caller always wins
+        if "RUSTC_WRAPPER" not in env and shutil.which("sccache"):
+            env["RUSTC_WRAPPER"] = "sccache"
+            env.setdefault("SCCACHE_DIR", str(self.project_root / ".sccache"))
+        
+        return env
+    
     def build_tauri_app(self) -> bool:
         """Build the Tauri application."""
         print("🦀 Building Tauri application...")
@@ -176,26 +435,33 @@ class PackagingPipeline:
             # Build command
             cmd = ["cargo", "tauri", "build"]
             
-            # Add target if specified
-            if "target" in self.config:
+            # Add target if specified (build-config.json ships "target": null)
+            if self.config.get("target"):
                 cmd.extend(["--target", self.config["target"]])
             
             # Add additional flags
             if self.config.get("release", True):
                 cmd.append("--release")
             
-            result = subprocess.run(cmd, cwd=self.project_root, 
-                                  capture_output=True, text=True)
+            # The frontend was already built alongside the sidecars; stop Tauri
+            # from running beforeBuildCommand (npm run build) a second time
+            if self._frontend_built:
+                cmd.extend(["--config", json.dumps({"build": {"beforeBuildCommand": None}})])
             
-            if result.returncode != 0:
-                print(f"❌ Tauri build failed:")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
-                return False
+            log_path = self._stage_log("tauri")
+            _run_streaming(cmd, self.project_root, log_path, env=self._rust_build_env())
+            
+            # The build replaced its outputs, so earlier stats are stale
+            self._stat_cache.clear()
+            self.__dict__.pop("_bundle_index", None)
             
             print("✅ Tauri application built successfully")
             return True
             
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Tauri build failed with exit code {e.returncode} (log: {log_path}):")
+            self._print_log_tail(log_path)
+            return False
         except Exception as e:
             print(f"❌ Tauri build error: {e}")
             return False
@@ -223,7 +489,7 @@ class PackagingPipeline:
         try:
             # Find the built executable
             exe_path = self.build_dir / "gytmdl-gui.exe"
-            if not exe_path.exists():
+            if self._stat(exe_path) is None:
                 print(f"❌ Executable not found: {exe_path}")
                 return False
             
@@ -248,9 +514,9 @@ class PackagingPipeline:
         """Sign macOS binaries using codesign."""
         try:
             # Find the built app bundle
-            app_path = self.build_dir / "bundle" / "macos" / "gytmdl-gui.app"
-            if not app_path.exists():
-                print(f"❌ App bundle not found: {app_path}")
+            app_path = self._find_bundle("app")
+            if app_path is None:
+                print(f"❌ App bundle not found in {self.build_dir / 'bundle' / 'macos'}")
                 return False
             
             # Sign the app bundle
@@ -282,10 +548,11 @@ class PackagingPipeline:
         print("📋 Notarizing macOS app...")
         
         try:
-            # Create zip for notarization
+            # Create zip for notarization; it is only a container for the
+            # upload, so store without compressing
             zip_path = app_path.parent / f"{app_path.stem}.zip"
             subprocess.run([
-                "ditto", "-c", "-k", "--keepParent",
+                "ditto", "-c", "-k", "--keepParent", "--zlibCompressionLevel", "0",
                 str(app_path), str(zip_path)
             ], check=True)
             
@@ -351,13 +618,70 @@ class PackagingPipeline:
             print(f"    ❌ Failed to create {format_name} installer: {e}")
             return None
     
+    @functools.cached_property
+    def _bundle_index(self) -> Dict[str, List[Path]]:
+        """Index built bundles by format with a single sweep of the bundle directory.
+        
+        Shared by signing and installer creation; dropped whenever a new
+        Tauri build replaces the bundles.
+        """
+        index: Dict[str, List[Tuple[float, Path]]] = {}
+        try:
+            with os.scandir(self.build_dir / "bundle") as format_dirs:
+                for format_dir in format_dirs:
+                    # Only list directories Tauri writes bundles to
+                    layout = _BUNDLE_DIR_FORMATS.get(format_dir.name)
+                    if layout is None or not format_dir.is_dir():
+                        continue
+                    format_name, suffix = layout
+                    # .app bundles are directories, installers are files
+                    want_dir = format_name == "app"
+                    with os.scandir(format_dir.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(suffix) and entry.is_dir() == want_dir:
+                                index.setdefault(format_name, []).append(
+                                    (entry.stat().st_mtime, Path(entry.path)))
+        except FileNotFoundError:
+            pass
+        
+        # Newest first, so leftovers from an older version never win
+        return {
+            format_name: [path for _, path in sorted(found, reverse=True)]
+            for format_name, found in index.items()
+        }
+    
+    def _find_bundle(self, format_name: str) -> Optional[Path]:
+        """Get the most recently built installer of a format, if any."""
+        found = self._bundle_index.get(format_name)
+        return found[0] if found else None
+    
+    def _stage(self, src: Path, dst: Path) -> None:
+        """Place a built artifact in the dist directory as an independent copy.
+        
+        Never a hard link: Tauri's bundlers truncate and rewrite their outputs
+        in place, which would change an installer that was already staged and
+        checksummed.
+        """
+        try:
+            dst.unlink()
+        except FileNotFoundError:
+            pass
+        self._stat_cache.pop(dst, None)
+        self._installer_checksums.pop(dst, None)
+        
+        # copyfile uses sendfile/copy_file_range where the OS supports it;
+        # carry over the timestamps copy2 used to keep, without the rest of copystat
+        src_stat = os.stat(src)
+        shutil.copyfile(src, dst)
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    
     def _create_msi_installer(self) -> Optional[Path]:
         """Create Windows MSI installer."""
         # MSI creation is handled by Tauri build process
-        msi_path = self.build_dir / "bundle" / "msi" / "gytmdl-gui_0.1.0_x64_en-US.msi"
-        if msi_path.exists():
+        msi_path = self._find_bundle("msi")
+        if msi_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}.msi"
-            shutil.copy2(msi_path, dest_path)
+            self._stage(msi_path, dest_path)
             print(f"    ✅ MSI installer created: {dest_path}")
             return dest_path
         return None
@@ -365,10 +689,10 @@ class PackagingPipeline:
     def _create_dmg_installer(self) -> Optional[Path]:
         """Create macOS DMG installer."""
         # DMG creation is handled by Tauri build process
-        dmg_path = self.build_dir / "bundle" / "dmg" / "gytmdl-gui_0.1.0_x64.dmg"
-        if dmg_path.exists():
+        dmg_path = self._find_bundle("dmg")
+        if dmg_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}.dmg"
-            shutil.copy2(dmg_path, dest_path)
+            self._stage(dmg_path, dest_path)
             print(f"    ✅ DMG installer created: {dest_path}")
             return dest_path
         return None
@@ -376,10 +700,10 @@ class PackagingPipeline:
     def _create_deb_installer(self) -> Optional[Path]:
         """Create Debian package."""
         # DEB creation is handled by Tauri build process
-        deb_path = self.build_dir / "bundle" / "deb" / "gytmdl-gui_0.1.0_amd64.deb"
-        if deb_path.exists():
+        deb_path = self._find_bundle("deb")
+        if deb_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}.deb"
-            shutil.copy2(deb_path, dest_path)
+            self._stage(deb_path, dest_path)
             print(f"    ✅ DEB package created: {dest_path}")
             return dest_path
         return None
@@ -387,10 +711,10 @@ class PackagingPipeline:
     def _create_rpm_installer(self) -> Optional[Path]:
         """Create RPM package."""
         # RPM creation is handled by Tauri build process
-        rpm_path = self.build_dir / "bundle" / "rpm" / "gytmdl-gui-0.1.0-1.x86_64.rpm"
-        if rpm_path.exists():
+        rpm_path = self._find_bundle("rpm")
+        if rpm_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}.rpm"
-            shutil.copy2(rpm_path, dest_path)
+            self._stage(rpm_path, dest_path)
             print(f"    ✅ RPM package created: {dest_path}")
             return dest_path
         return None
@@ -398,10 +722,10 @@ class PackagingPipeline:
     def _create_appimage_installer(self) -> Optional[Path]:
         """Create AppImage."""
         # AppImage creation is handled by Tauri build process
-        appimage_path = self.build_dir / "bundle" / "appimage" / "gytmdl-gui_0.1.0_amd64.AppImage"
-        if appimage_path.exists():
+        appimage_path = self._find_bundle("appimage")
+        if appimage_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}.AppImage"
-            shutil.copy2(appimage_path, dest_path)
+            self._stage(appimage_path, dest_path)
             print(f"    ✅ AppImage created: {dest_path}")
             return dest_path
         return None
@@ -409,32 +733,66 @@ class PackagingPipeline:
     def _create_nsis_installer(self) -> Optional[Path]:
         """Create NSIS installer."""
         # NSIS creation is handled by Tauri build process
-        nsis_path = self.build_dir / "bundle" / "nsis" / "gytmdl-gui_0.1.0_x64-setup.exe"
-        if nsis_path.exists():
+        nsis_path = self._find_bundle("nsis")
+        if nsis_path:
             dest_path = self.dist_dir / f"gytmdl-gui-{self.platform_info['target']}-setup.exe"
-            shutil.copy2(nsis_path, dest_path)
+            self._stage(nsis_path, dest_path)
             print(f"    ✅ NSIS installer created: {dest_path}")
             return dest_path
         return None
     
+    @staticmethod
+    def calculate_checksum(file_path: Path) -> str:
+        """Calculate the SHA256 checksum of a file."""
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the whole read loop runs in C
+                return hashlib.file_digest(f, "sha256", _bufsize=HASH_BUFFER_SIZE).hexdigest()
+            
+            # Hash the whole file in one C-level call over the mapped pages
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()
+            except (OSError, ValueError, OverflowError):
+                # Empty files and some filesystems cannot be mapped
+                pass
+            
+            sha256_hash = hashlib.sha256()
+            buffer = bytearray(HASH_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                sha256_hash.update(view[:n])
+            return sha256_hash.hexdigest()
+    
+    def _sha256(self, file_path: Path) -> Tuple[Path, str]:
+        """Pair a file with its SHA256 checksum, hashing each staged installer only once."""
+        checksum = self._installer_checksums.get(file_path)
+        if checksum is None:
+            checksum = self.calculate_checksum(file_path)
+            self._installer_checksums[file_path] = checksum
+        return file_path, checksum
+    
     def generate_checksums(self, files: List[Path]) -> Path:
         """Generate checksum file for all installers."""
         print("🔐 Generating checksums...")
         
         checksums_file = self.dist_dir / "checksums.txt"
+        files = [file_path for file_path in files if self._stat(file_path) is not None]
         
-        with open(checksums_file, "w") as f:
-            for file_path in files:
-                if file_path.exists():
-                    # Calculate SHA256
-                    import hashlib
-                    sha256_hash = hashlib.sha256()
-                    with open(file_path, "rb") as binary_file:
-                        for chunk in iter(lambda: binary_file.read(4096), b""):
-                            sha256_hash.update(chunk)
-                    
-                    checksum = sha256_hash.hexdigest()
-                    f.write(f"{checksum}  {file_path.name}\n")
+        # hashlib releases the GIL while hashing, so installers hash in parallel
+        results = []
+        if files:
+            with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(self._sha256, files))
+        
+        lines = [
+            f"{checksum}  {file_path.name}\n"
+            for file_path, checksum in sorted(results, key=lambda item: item[0].name)
+        ]
+        checksums_file.write_bytes("".join(lines).encode())
         
         print(f"✅ Checksums generated: {checksums_file}")
         return checksums_file
@@ -445,10 +803,30 @@ class PackagingPipeline:
         print(f"Platform: {self.platform_info['os']} {self.platform_info['arch']}")
         print(f"Target: {self.platform_info['target']}")
         
+        print("\n📋 Step: Check dependencies")
+        if not self.check_dependencies():
+            print("❌ Pipeline failed at step: Check dependencies")
+            return False
+        
+        # The sidecar and frontend builds are independent; only the Tauri
+        # build needs both, so run them side by side.
+        print("\n📋 Step: Build sidecar binaries + frontend")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(self.build_sidecar_binaries): "Build sidecar binaries",
+                executor.submit(self.build_frontend): "Build frontend",
+            }
+            wait(futures)
+        
+        for future, step_name in futures.items():
+            error = future.exception()
+            if error is not None:
+                print(f"❌ {step_name} raised: {error}")
+            if error is not None or not future.result():
+                print(f"❌ Pipeline failed at step: {step_name}")
+                return False
+        
         steps = [
-            ("Check dependencies", self.check_dependencies),
-            ("Build sidecar binaries", self.build_sidecar_binaries),
-            ("Build frontend", self.build_frontend),
             ("Build Tauri app", self.build_tauri_app),
             ("Sign binaries", self.sign_binaries),
         ]
@@ -480,12 +858,23 @@ class PackagingPipeline:
         return True
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime: float) -> Dict:
+    """Parse a config file; keyed on mtime so edits are picked up."""
+    with open(config_path) as f:
+        return json.load(f)
+
+
 def load_config(config_path: Path) -> Dict:
-    """Load build configuration from JSON file."""
-    if config_path.exists():
-        with open(config_path) as f:
-            return json.load(f)
-    else:
+    """Load build configuration from JSON file.
+    
+    Repeated loads of an unchanged file return the same (shared) dict,
+    however the path is spelled.
+    """
+    try:
+        config_path = config_path.resolve()
+        mtime = os.path.getmtime(config_path)
+    except OSError:
         # Return default configuration
         return {
             "release": True,
@@ -493,6 +882,7 @@ def load_config(config_path: Path) -> Dict:
                 "enabled": False
             }
         }
+    return _parse_config(str(config_path), mtime)
 
 
 def main():
@@ -504,6 +894,8 @@ def main():
     parser.add_argument("--project-root", type=Path,
                        default=Path(__file__).parent.parent,
                        help="Project root directory")
+    parser.add_argument("--clean", action="store_true",
+                       help="Discard cached sidecar build state and rebuild from scratch")
     
     args = parser.parse_args()
     
@@ -511,7 +903,7 @@ def main():
     config = load_config(args.config)
     
     # Create and run pipeline
-    pipeline = PackagingPipeline(args.project_root, config)
+    pipeline = PackagingPipeline(args.project_root, config, clean=args.clean)
     success = pipeline.run_full_pipeline()
     
     sys.exit(0 if success else 1)
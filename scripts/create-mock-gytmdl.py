@@ -6,36 +6,30 @@ This mock binary simulates the behavior of gytmdl for UI testing purposes.
 
 import os
 import sys
+import json
+import hashlib
 import time
 import random
+import datetime
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional
 
-def create_mock_binary():
-    """Create a mock gytmdl binary that simulates download progress."""
-    
-    # Determine the correct binary name for the current platform
-    if sys.platform == "win32":
-        if "64" in str(sys.maxsize):
-            binary_name = "gytmdl-x86_64-pc-windows-msvc.exe"
-        else:
-            binary_name = "gytmdl.exe"
-    elif sys.platform == "darwin":
-        import platform
-        if platform.machine() == "arm64":
-            binary_name = "gytmdl-aarch64-apple-darwin"
-        else:
-            binary_name = "gytmdl-x86_64-apple-darwin"
-    elif sys.platform.startswith("linux"):
-        import platform
-        if platform.machine() == "x86_64":
-            binary_name = "gytmdl-x86_64-unknown-linux-gnu"
-        else:
-            binary_name = "gytmdl"
-    else:
-        binary_name = "gytmdl"
-    
-    # Create the mock binary script
-    mock_script = f'''#!/usr/bin/env python3
+from _platform import UnsupportedPlatformError, binary_name as sidecar_binary_name
+
+# Targets the release workflow builds sidecars for
+MOCK_TARGETS = [
+    ("x86_64-pc-windows-msvc", ".exe"),
+    ("x86_64-apple-darwin", ""),
+    ("aarch64-apple-darwin", ""),
+    ("x86_64-unknown-linux-gnu", ""),
+]
+
+SIDECARS_DIR = Path(__file__).parent.parent / "src-tauri" / "sidecars"
+
+# The mock script is the same for every target, so it is built and hashed once
+MOCK_SCRIPT = '''#!/usr/bin/env python3
 """
 Mock gytmdl binary for testing gytmdl-gui.
 This simulates the behavior of the real gytmdl binary.
@@ -46,6 +40,14 @@ import time
 import random
 import os
 
+# GYTMDL_MOCK_SPEED scales the simulated delays, e.g. 10 for fast test runs
+# and 0 for no delay at all
+try:
+    SPEED = float(os.environ.get("GYTMDL_MOCK_SPEED", "1"))
+except ValueError:
+    SPEED = 1.0
+SLEEP_UNIT = 0.1 / SPEED if SPEED > 0 else 0.0
+
 def main():
     args = sys.argv[1:]
     
@@ -65,6 +67,7 @@ def main():
         print("  --temp-path DIR    Temporary directory")
         print("  --progress         Show progress")
         print("  --verbose          Verbose output")
+        print("Set GYTMDL_MOCK_SPEED to speed up (or 0 to skip) the simulated delays")
         return 0
     
     # Find the URL (last argument that looks like a URL)
@@ -79,9 +82,11 @@ def main():
         return 1
     
     # Simulate download process
-    print(f"Starting download: {{url}}")
-    print("Initializing...")
-    time.sleep(0.5)
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    write("Starting download: %s\\nInitializing...\\n" % url)
+    flush()
+    time.sleep(5 * SLEEP_UNIT)
     
     # Simulate progress updates
     stages = [
@@ -92,71 +97,119 @@ def main():
         "Finalizing"
     ]
     
-    for i, stage in enumerate(stages):
-        print(f"[INFO] {{stage}}...")
+    # A fixed seed keeps the progress steps the same from run to run
+    rng = random.Random(42)
+    
+    for stage in stages:
+        write("[INFO] %s...\\n" % stage)
         
-        # Simulate progress within each stage
-        for progress in range(0, 101, random.randint(5, 15)):
-            if progress > 100:
-                progress = 100
-            print(f"Progress: {{progress}}% - {{stage}}")
-            time.sleep(0.1)
+        # Simulate progress within each stage; each update is flushed so a
+        # reader on the other end of a pipe sees it before the next delay
+        for progress in range(0, 101, rng.randint(5, 15)):
+            write("Progress: %d%% - %s\\n" % (progress, stage))
+            flush()
+            time.sleep(SLEEP_UNIT)
         
-        time.sleep(0.2)
+        time.sleep(2 * SLEEP_UNIT)
     
     print("Download completed successfully!")
-    print(f"Saved to: mock_output/{{url.split('/')[-1]}}.mp3")
+    print(f"Saved to: mock_output/{url.split('/')[-1]}.mp3")
     
     return 0
 
 if __name__ == "__main__":
     sys.exit(main())
 '''
+MOCK_SCRIPT_BYTES = MOCK_SCRIPT.encode()
+MOCK_SCRIPT_SHA256 = hashlib.sha256(MOCK_SCRIPT_BYTES).hexdigest()
+
+def create_mock_binary(binary_name: Optional[str] = None) -> Path:
+    """Create a mock gytmdl binary that simulates download progress."""
+    
+    # Default to the correct binary name for the current platform
+    if binary_name is None:
+        try:
+            binary_name = sidecar_binary_name("gytmdl")
+        except UnsupportedPlatformError:
+            binary_name = "gytmdl"
     
     # Create the sidecars directory
-    project_root = Path(__file__).parent.parent
-    sidecars_dir = project_root / "src-tauri" / "sidecars"
-    sidecars_dir.mkdir(parents=True, exist_ok=True)
+    SIDECARS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Write the mock binary
-    binary_path = sidecars_dir / binary_name
-    with open(binary_path, "w") as f:
-        f.write(mock_script)
+    binary_path = SIDECARS_DIR / binary_name
+    manifest_path = binary_path.with_suffix(".json")
     
-    # Make it executable on Unix systems
-    if os.name == 'posix':
+    # The mock is a pure function of its name, so leave an identical one alone
+    # rather than bumping mtimes and making Tauri re-bundle it
+    try:
+        existing_size = binary_path.stat().st_size
+    except OSError:
+        existing_size = None
+    if existing_size == len(MOCK_SCRIPT_BYTES):
+        try:
+            with open(manifest_path) as f:
+                if json.load(f).get("sha256") == MOCK_SCRIPT_SHA256:
+                    return binary_path
+        except (OSError, ValueError):
+            pass
+    
+    # Write the mock binary; a newly created file gets its executable
+    # mode from the open call itself
+    fd = os.open(binary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o755)
+    with os.fdopen(fd, "wb") as f:
+        f.write(MOCK_SCRIPT_BYTES)
+    
+    # An existing file keeps its old mode, so make it executable on Unix systems
+    if existing_size is not None and os.name == 'posix':
         os.chmod(binary_path, 0o755)
     
-    # Create a simple manifest
-    manifest_content = f'''{{
-    "binary_name": "{binary_name}",
-    "platform": {{
-        "os": "{sys.platform}",
-        "arch": "{sys.maxsize}",
-        "target": "mock-target",
-        "extension": "{'.exe' if sys.platform == 'win32' else ''}"
-    }},
-    "size_bytes": {binary_path.stat().st_size},
-    "sha256": "mock-hash-for-testing",
-    "build_timestamp": "2024-01-01T00:00:00Z"
-}}'''
-    
-    manifest_path = binary_path.with_suffix(".json")
-    with open(manifest_path, "w") as f:
-        f.write(manifest_content)
-    
-    print(f"✅ Created mock gytmdl binary: {binary_path}")
-    print(f"✅ Created manifest: {manifest_path}")
-    print(f"📁 Sidecar directory: {sidecars_dir}")
+    # Create a simple manifest; the architecture is the first component of
+    # the target triple in the binary name, e.g. x86_64
+    manifest = {
+        "binary_name": binary_name,
+        "platform": {
+            "os": sys.platform,
+            "arch": binary_name.partition("-")[2].split("-")[0] or "unknown",
+            "target": "mock-target",
+            "extension": ".exe" if binary_name.endswith(".exe") else ""
+        },
+        "size_bytes": len(MOCK_SCRIPT_BYTES),
+        "sha256": MOCK_SCRIPT_SHA256,
+        "build_timestamp": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    }
+    
+    manifest_path.write_text(json.dumps(manifest, indent=4))
     
     return binary_path
 
+def create_mock_binaries_for_all_targets() -> List[Path]:
+    """Create mock binaries for every release target at once."""
+    binary_names = [f"gytmdl-{target}{extension}" for target, extension in MOCK_TARGETS]
+    
+    # Each mock is an independent pair of small files, so write them concurrently
+    with ThreadPoolExecutor(max_workers=len(binary_names)) as executor:
+        return list(executor.map(create_mock_binary, binary_names))
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Create mock gytmdl sidecar binaries for testing")
+    parser.add_argument("--all-targets", action="store_true",
+                       help="Create mocks for every release target, not just this platform")
+    args = parser.parse_args()
+    
     print("🔨 Creating mock gytmdl binary for testing...")
     
     try:
-        binary_path = create_mock_binary()
+        if args.all_targets:
+            binary_paths = create_mock_binaries_for_all_targets()
+        else:
+            binary_paths = [create_mock_binary()]
+        
+        for binary_path in binary_paths:
+            print(f"✅ Created mock gytmdl binary: {binary_path}")
+            print(f"✅ Created manifest: {binary_path.with_suffix('.json')}")
+        print(f"📁 Sidecar directory: {SIDECARS_DIR}")
+        
         print(f"\\n🎉 Mock binary created successfully!")
         print(f"\\nNow you can test the gytmdl-gui application:")
         print(f"1. Run: npm run tauri dev")
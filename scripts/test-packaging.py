@@ -9,11 +9,26 @@ import sys
 import subprocess
 import platform
 import json
+import functools
 import tempfile
 import shutil
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+
+@functools.lru_cache(maxsize=8)
+def _parse_json(path: str, mtime: float) -> Dict:
+    """Parse a JSON file; keyed on mtime so edits are picked up."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_json(path: Path) -> Dict:
+    """Load a JSON file, reusing the parsed result while it is unchanged."""
+    return _parse_json(os.fspath(path), os.path.getmtime(path))
+
+
 class PackagingTestRunner:
     """Test runner for packaging functionality."""
     
@@ -43,6 +58,18 @@ class PackagingTestRunner:
             self.failed_tests.append(test_name)
             return False
     
+    def _run_logged(self, cmd: List[str], cwd: Path, timeout: int) -> Tuple[int, List[str]]:
+        """Run a command with its output spooled to a temp file instead of memory.
+        
+        Returns the exit code and the last lines of output for failure reports.
+        """
+        with tempfile.TemporaryFile(mode="w+", errors="replace") as log:
+            result = subprocess.run(cmd, cwd=cwd, stdout=log,
+                                    stderr=subprocess.STDOUT, timeout=timeout)
+            log.seek(0)
+            tail = deque(log, maxlen=20)
+        return result.returncode, [line.rstrip() for line in tail]
+    
     def test_project_structure(self) -> bool:
         """Test that the project has the correct structure for packaging."""
         required_files = [
@@ -53,6 +80,7 @@ class PackagingTestRunner:
             "build-scripts/build-sidecars.py",
             "build-scripts/pyinstaller-config.spec",
             "scripts/build-and-package.py",
+            "scripts/_platform.py",
         ]
         
         for file_path in required_files:
@@ -70,7 +98,8 @@ class PackagingTestRunner:
         
         for dir_path in required_dirs:
             full_path = self.project_root / dir_path
-            if not full_path.exists() or not full_path.is_dir():
+            # is_dir() is False for missing paths too, so one stat covers both
+            if not full_path.is_dir():
                 print(f"    Missing required directory: {dir_path}")
                 return False
         
@@ -81,8 +110,7 @@ class PackagingTestRunner:
         config_path = self.project_root / "src-tauri" / "tauri.conf.json"
         
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = load_json(config_path)
             
             # Check essential fields
             required_fields = ["productName", "version", "identifier", "bundle"]
@@ -127,8 +155,7 @@ class PackagingTestRunner:
         config_path = self.project_root / "build-config.json"
         
         try:
-            with open(config_path) as f:
-                config = json.load(f)
+            config = load_json(config_path)
             
             # Check essential sections
             required_sections = ["release", "code_signing", "bundle"]
@@ -159,8 +186,7 @@ class PackagingTestRunner:
         package_path = self.project_root / "package.json"
         
         try:
-            with open(package_path) as f:
-                package = json.load(f)
+            package = load_json(package_path)
             
             # Check essential fields
             required_fields = ["name", "version", "scripts", "devDependencies"]
@@ -238,14 +264,16 @@ class PackagingTestRunner:
         for script_path, should_be_executable in scripts_to_check:
             full_path = self.project_root / script_path
             
-            if not full_path.exists():
+            # One stat answers both whether the script exists and its mode
+            try:
+                stat_info = full_path.stat()
+            except FileNotFoundError:
                 print(f"    Missing build script: {script_path}")
                 return False
             
             # Check if shell scripts are executable (Unix only)
             if should_be_executable and os.name == 'posix':
                 if script_path.endswith('.sh') or script_path.endswith('.py'):
-                    stat_info = full_path.stat()
                     if not (stat_info.st_mode & 0o111):
                         print(f"    Script not executable: {script_path}")
                         return False
@@ -275,57 +303,53 @@ class PackagingTestRunner:
         """Test that GitHub Actions workflow is properly configured."""
         workflow_path = self.project_root / ".github" / "workflows" / "build-and-release.yml"
         
-        if not workflow_path.exists():
-            print("    Missing GitHub Actions workflow")
-            return False
-        
         try:
             with open(workflow_path) as f:
                 workflow_content = f.read()
-            
-            # Check for essential workflow components
-            required_content = [
-                "name: Build and Release",
-                "build-sidecars",
-                "build-tauri",
-                "create-release",
-                "test-installers",
-                "macos-latest",
-                "ubuntu-20.04",
-                "windows-latest",
-                "x86_64-apple-darwin",
-                "aarch64-apple-darwin",
-                "x86_64-unknown-linux-gnu",
-                "x86_64-pc-windows-msvc",
-            ]
-            
-            for content in required_content:
-                if content not in workflow_content:
-                    print(f"    Missing workflow content: {content}")
-                    return False
-            
-            return True
-            
-        except Exception as e:
+        except FileNotFoundError:
+            print("    Missing GitHub Actions workflow")
+            return False
+        except (OSError, UnicodeDecodeError) as e:
             print(f"    Error reading workflow: {e}")
             return False
+        
+        # Check for essential workflow components
+        required_content = [
+            "name: Build and Release",
+            "build-sidecars",
+            "build-tauri",
+            "create-release",
+            "test-installers",
+            "macos-latest",
+            "ubuntu-20.04",
+            "windows-latest",
+            "x86_64-apple-darwin",
+            "aarch64-apple-darwin",
+            "x86_64-unknown-linux-gnu",
+            "x86_64-pc-windows-msvc",
+        ]
+        
+        for content in required_content:
+            if content not in workflow_content:
+                print(f"    Missing workflow content: {content}")
+                return False
+        
+        return True
     
     def test_rust_compilation(self) -> bool:
         """Test that the Rust code compiles successfully."""
         try:
             # Run cargo check to verify compilation
-            result = subprocess.run(
+            returncode, output = self._run_logged(
                 ["cargo", "check"],
                 cwd=self.project_root / "src-tauri",
-                capture_output=True,
-                text=True,
                 timeout=120  # 2 minute timeout
             )
             
-            if result.returncode != 0:
+            if returncode != 0:
                 print(f"    Cargo check failed:")
-                print(f"    STDOUT: {result.stdout}")
-                print(f"    STDERR: {result.stderr}")
+                for line in output:
+                    print(f"    {line}")
                 return False
             
             return True
@@ -347,31 +371,29 @@ class PackagingTestRunner:
             node_modules = self.project_root / "node_modules"
             if not node_modules.exists():
                 print("    Installing npm dependencies...")
-                result = subprocess.run(
+                returncode, output = self._run_logged(
                     ["npm", "install"],
                     cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
                     timeout=300  # 5 minute timeout
                 )
                 
-                if result.returncode != 0:
+                if returncode != 0:
                     print(f"    npm install failed:")
-                    print(f"    STDERR: {result.stderr}")
+                    for line in output:
+                        print(f"    {line}")
                     return False
             
             # Run build
-            result = subprocess.run(
+            returncode, output = self._run_logged(
                 ["npm", "run", "build"],
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
                 timeout=120  # 2 minute timeout
             )
             
-            if result.returncode != 0:
+            if returncode != 0:
                 print(f"    Frontend build failed:")
-                print(f"    STDERR: {result.stderr}")
+                for line in output:
+                    print(f"    {line}")
                 return False
             
             # Check if dist directory was created
@@ -459,7 +481,8 @@ class PackagingTestRunner:
     def run_all_tests(self) -> bool:
         """Run all packaging tests."""
         print("🚀 Running gytmdl-gui packaging tests...")
-        print(f"Platform: {platform.system()} {platform.machine()}")
+        uname = platform.uname()
+        print(f"Platform: {uname.system} {uname.machine}")
         print(f"Project root: {self.project_root}")
         
         tests = [